@@ -2,8 +2,15 @@
 
 import os
 import tomllib
+from functools import cached_property, lru_cache
 from typing import Any
 
+try:
+    # Optional Rust-backed parser; same load() API as tomllib.
+    import tomli_rs as _toml
+except ImportError:
+    _toml = tomllib
+
 HOME_DIR: str | None = os.environ.get("HOME")
 assert HOME_DIR
 LOCAL_SHARE: str = os.path.join(HOME_DIR, ".local/share")
@@ -11,38 +18,79 @@ HW_DATA_DIR: str = os.path.join(LOCAL_SHARE, "pygrader")
 XDG_CONFIG_HOME = os.environ.get("XDG_CONFIG_HOME", os.path.join(HOME_DIR, ".config"))
 CONFIG_FILE = os.path.join(XDG_CONFIG_HOME, "pygrader.toml")
 
+# Process-wide caches so repeated Env() construction (one per HW, plus one in
+# grade.py) doesn't re-stat and re-parse the same files.
+_CONFIG_CACHE: dict[str, dict[str, Any]] = {}
+# Directories known to exist; dirs aren't expected to vanish mid-session.
+_ENSURED: set[str] = set()
+
+
+@lru_cache(maxsize=64)
+def _hw_path(root: str, name: str) -> str:
+    # POSIX-only, like the rest of Env (see LOCAL_SHARE above).
+    return f"{root}/{name}"
+
+
+def _ensure_dir(path: str) -> None:
+    if path in _ENSURED:
+        return
+    os.makedirs(path, 0o755, True)
+    _ENSURED.add(path)
+
 
 class Env:
     def __init__(self, root_dir: str = HW_DATA_DIR) -> None:
         self.root_dir: str = root_dir
         self.ensure_data_dir()
-        self.config: dict[str, Any] = {}
-        if os.path.isfile(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, "rb") as f:
-                    self.config = tomllib.load(f)
-            except tomllib.TOMLDecodeError as e:
-                print(f"Failed to decode '{CONFIG_FILE}': {e}")
-                # allow failure to parse config file and just ignore it
+
+    @cached_property
+    def config(self) -> dict[str, Any]:
+        """The parsed config file, loaded on first access."""
+        # The config file location doesn't depend on root_dir, so key on it.
+        if CONFIG_FILE not in _CONFIG_CACHE:
+            config: dict[str, Any] = {}
+            if os.path.isfile(CONFIG_FILE):
+                try:
+                    with open(CONFIG_FILE, "rb") as f:
+                        config = _toml.load(f)
+                except (tomllib.TOMLDecodeError, ValueError) as e:
+                    print(f"Failed to decode '{CONFIG_FILE}': {e}")
+                    # allow failure to parse config file and just ignore it
+            _CONFIG_CACHE[CONFIG_FILE] = config
+        return _CONFIG_CACHE[CONFIG_FILE]
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forgets cached config and data dir checks (e.g. for tests)."""
+        _CONFIG_CACHE.clear()
+        _ENSURED.clear()
 
     def ensure_data_dir(self) -> None:
-        os.makedirs(self.root_dir, 0o755, True)
+        _ensure_dir(self.root_dir)
 
     def get_data_dir(self) -> str:
         return self.root_dir
 
     def make_hw_dir(self, name: str) -> None:
         # fail loud if dir already exists -- should be handled by caller
-        os.makedirs(os.path.join(self.root_dir, name), 0o755, False)
+        path = _hw_path(self.root_dir, name)
+        os.makedirs(path, 0o755, False)
+        _ENSURED.add(path)
 
     def has_hw_dir(self, name: str) -> bool:
-        return os.path.isdir(os.path.join(self.root_dir, name))
+        path = _hw_path(self.root_dir, name)
+        if path in _ENSURED:
+            return True
+        if os.path.isdir(path):
+            _ENSURED.add(path)
+            return True
+        return False
 
     def ensure_hw_dir(self, name: str) -> None:
-        os.makedirs(os.path.join(self.root_dir, name), 0o755, True)
+        _ensure_dir(_hw_path(self.root_dir, name))
 
     def get_hw_dir(self, name: str) -> str:
-        return os.path.join(self.root_dir, name)
+        return _hw_path(self.root_dir, name)
 
     def get_config(self) -> dict[str, Any]:
         return self.config
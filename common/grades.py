@@ -11,6 +11,9 @@ import common.utils as utils
 
 DEFAULT_LATE_PENALTY = 0.2
 
+# Number of mark_dirty() calls allowed to accumulate before writing to disk.
+FLUSH_INTERVAL = 5
+
 # Probably better to just look at a grades.json
 GradesDictType = dict[
     str,  # Submitter
@@ -32,14 +35,23 @@ class Grades:
         grades_file: the JSON file with grades
         rubric: the rubric object for a given hw
         submitter: The uni/team we're currently grading
+        read_only: If set, grades are never written back to grades_file
         _grades: Maps submitter -> (is_late, (item -> (pts, comments)))
     """
 
-    def __init__(self, grades_file: str, rubric: dict[str, Any], name: str):
+    def __init__(
+        self,
+        grades_file: str,
+        rubric: dict[str, Any],
+        name: str,
+        read_only: bool = False,
+    ):
         self.grades_file = os.path.abspath(grades_file)
         self.rubric = rubric
         self.submitter = name
+        self.read_only = read_only
         self._grades = self.load_grades()
+        self._pending = 0  # changes not yet written out
 
         if self.submitter and self.submitter not in self._grades:
             # This is the first time grading the submission
@@ -54,7 +66,7 @@ class Grades:
             for item_code in sorted(self.rubric[table_code].keys()):
                 item = self.rubric[table_code][item_code]
                 for subitem_code in range(1, len(item.subitems) + 1):
-                    code = f"{item_code}.{subitem_code}"
+                    code = sys.intern(f"{item_code}.{subitem_code}")
                     if code in subitems:
                         sys.exit(f"Rubric subitem '{code}' defined twice!")
 
@@ -75,7 +87,12 @@ class Grades:
         # anything has changed.
         defined_subitems = self._get_defined_rubric_subitems()
         for grade_info in grades.values():
-            scores = grade_info["scores"]
+            # Intern keys so lookups with RubricItem.subitem_codes (also
+            # interned) can match by identity.
+            scores = grade_info["scores"] = {
+                sys.intern(code): score
+                for code, score in grade_info["scores"].items()
+            }
             present_subitems = set(scores.keys())
 
             for code in defined_subitems.symmetric_difference(present_subitems):
@@ -99,7 +116,7 @@ class Grades:
             for item_code in sorted(self.rubric[table_code].keys()):
                 item = self.rubric[table_code][item_code]
                 for subitem_code in range(1, len(item.subitems) + 1):
-                    code = f"{item_code}.{subitem_code}"
+                    code = sys.intern(f"{item_code}.{subitem_code}")
                     # None means that it hasn't been graded yet
                     rubric_scores[code] = {"award": None, "comments": None}
         self._grades[self.submitter]["scores"] = rubric_scores
@@ -110,10 +127,24 @@ class Grades:
 
     def synchronize(self):
         """Write out the grades dictionary to the filesystem"""
+        if self.read_only:
+            return
         with open(self.grades_file, "w") as f:
             # Indent for pretty printing :^)
             json.dump(self._grades, f, indent=4, sort_keys=True)
             os.fsync(f.fileno())
+        self._pending = 0
+
+    def mark_dirty(self):
+        """Records an in-memory change, writing out every FLUSH_INTERVAL."""
+        self._pending += 1
+        if self._pending >= FLUSH_INTERVAL:
+            self.synchronize()
+
+    def flush(self):
+        """Writes out the grades dictionary if there are pending changes"""
+        if self._pending:
+            self.synchronize()
 
     def is_graded(self, code: str, name: str | None = None) -> bool:
         """Checks if a subitem has been graded yet"""
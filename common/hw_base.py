@@ -3,15 +3,24 @@
 import json
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable
 
+import git
+
 import common.env as e
 import common.printing as printing
 import common.submissions as subs
 import common.utils as u
 
+# Find grader root relative to hw_base.py: root/common/hw_base.py
+_PYGRADER_ROOT: str = str(Path(__file__).resolve().parent.parent)
+
+# Parsed rubric JSON keyed by (path, mtime), shared across HW instances.
+_RUBRIC_CACHE: dict[tuple[str, float], dict[str, Any]] = {}
+
 
 @dataclass
 class RubricItem:
@@ -23,6 +32,8 @@ class RubricItem:
         tester: Callback function to grade this item.
         pretester: Optional Callback function to do pre-grading run and collect
           Gradable artifacts.
+        subitem_codes: Codes of each subitem (e.g. B1.1, B1.2), derived from
+          code/subitems so grading loops don't rebuild them.
     """
 
     code: str
@@ -30,6 +41,14 @@ class RubricItem:
     subitems: list[tuple[int, str]]
     tester: Callable[..., Any]
     pretester: Callable[..., Any] | None = None
+    subitem_codes: list[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Interned so grade dict lookups can match by identity.
+        self.subitem_codes = [
+            sys.intern(f"{self.code}.{i}")
+            for i in range(1, len(self.subitems) + 1)
+        ]
 
 
 class HW:
@@ -60,15 +79,14 @@ class HW:
         self.env = e.Env()
         self.hw_workspace: str = self.env.get_hw_dir(hw_name)
 
-        # Find grader root relative to hw_base.py: root/common/hw_base.py
-        pygrader_root = Path(__file__).resolve().parent.parent
-
-        self.scripts_dir: str = os.path.join(pygrader_root, self.hw_name)
+        self.scripts_dir: str = os.path.join(_PYGRADER_ROOT, self.hw_name)
 
         # Here we assume the rubric file is in the hw workspace dir, since
         # rubrics are per HW.
-        rubric_path = os.path.join(self.hw_workspace, rubric_name)
-        self.rubric: dict[str, Any] = self.create_rubric(rubric_path)
+        self.rubric_path: str = os.path.join(self.hw_workspace, rubric_name)
+
+        # Maps repo/commit -> late status; see check_late_submission.
+        self._late_cache: dict[str, bool] = {}
 
         # NOTE: revised submission_dir to be an abstract method to be filled
         # in.
@@ -76,6 +94,11 @@ class HW:
         # Used to be:
         # self.submission_dir: str | None = None  # Populated in subclasses.
 
+    @cached_property
+    def rubric(self) -> dict[str, Any]:
+        """Python representation of the rubric, built on first access."""
+        return self.create_rubric(self.rubric_path)
+
     def submission_dir(self) -> str:
         """Implement this method to inform the grader where to find submissions."""
         raise NotImplementedError
@@ -111,9 +134,27 @@ class HW:
     def create_rubric(self, rubric_file: str) -> dict[str, Any]:
         """Parses a JSON rubric file into a Python representation."""
 
-        # TODO check if file exists
-        with open(rubric_file, "r") as f:
-            rubric_json: dict[str, Any] = json.load(f)
+        # The JSON is cached, but testers are rebound since bound methods
+        # differ per instance.
+        try:
+            key = (rubric_file, os.path.getmtime(rubric_file))
+            rubric_json = _RUBRIC_CACHE.get(key)
+            if rubric_json is None:
+                with open(rubric_file, "r") as f:
+                    rubric_json = json.load(f)
+                _RUBRIC_CACHE[key] = rubric_json
+        except FileNotFoundError:
+            sys.exit(
+                f"Rubric '{rubric_file}' not found -- "
+                "please run hw_setup before grading"
+            )
+
+        # One pass over dir() instead of two getattr() lookups per item.
+        methods: dict[str, Callable[..., Any]] = {
+            name: getattr(self, name)
+            for name in dir(self)
+            if name.startswith(("grade_", "pre_grade_"))
+        }
 
         rubric: dict[str, Any] = {}
         for table_k, table_v in rubric_json.items():
@@ -136,8 +177,8 @@ class HW:
                             table_v[item]["desc_per_subitem"],
                         )
                     ),
-                    getattr(self, "grade_" + item, self.default_grader),
-                    pretester=getattr(self, "pre_grade_" + item, None),
+                    methods.get("grade_" + item, self.default_grader),
+                    pretester=methods.get("pre_grade_" + item),
                 )
                 rubric[table_k][item] = ri_obg
         return rubric
@@ -158,15 +199,44 @@ class HW:
         u.is_dir(part_dir)
         os.chdir(part_dir)
 
+    def _git_head(self) -> str | None:
+        """Identifies the repo and commit checked out at the cwd, if any."""
+        try:
+            with git.Repo(search_parent_directories=True) as repo:
+                commit = git.SymbolicReference.dereference_recursive(
+                    repo, "HEAD"
+                )
+                return f"{repo.working_dir}:{commit}"
+        except (git.InvalidGitRepositoryError, ValueError):
+            # Not in a repo, or HEAD doesn't point at a commit yet.
+            return None
+
     def check_late_submission(self):
-        """Grabs the latest commit timestamp to compare against the deadline"""
+        """Grabs the latest commit timestamp to compare against the deadline
+
+        The result is cached per checked-out commit, since it can't change
+        while grading the same checkout. On a cache hit only the short
+        on-time/late banner is reprinted, not the late details.
+        """
+        head = self._git_head()
+        if head is not None and head in self._late_cache:
+            is_late = self._late_cache[head]
+            if is_late:
+                printing.print_red("[SUBMISSION LATE]")
+            else:
+                printing.print_green("[ SUBMISSION ON TIME ]")
+            return is_late
+
         proc = u.cmd_popen("git log -n 1 --format='%aI'")
         iso_timestamp, _ = proc.communicate()
 
-        return subs.check_late(
+        is_late = subs.check_late(
             os.path.join(self.hw_workspace, "deadline.txt"),
             iso_timestamp.strip("\n"),
         )
+        if head is not None:
+            self._late_cache[head] = is_late
+        return is_late
 
 
 def directory(start_dir: str) -> Callable[..., Any]:
@@ -49,37 +49,37 @@ CWHITEBG2 = "\33[107m"
 
 def print_red(s: str) -> None:
     """Prints s in red"""
-    print("{}{}{}".format(CRED2, s, CEND))
+    print(f"{CRED2}{s}{CEND}")
 
 
 def print_green(s: str) -> None:
     """Prints s in green"""
-    print("{}{}{}".format(CGREEN2, s, CEND))
+    print(f"{CGREEN2}{s}{CEND}")
 
 
 def print_yellow(s: str) -> None:
     """Prints s in yellow"""
-    print("{}{}{}".format(CYELLOW2, s, CEND))
+    print(f"{CYELLOW2}{s}{CEND}")
 
 
 def print_magenta(s: str) -> None:
     """Prints s in magenta"""
-    print("{}{}{}".format(CVIOLET2, s, CEND))
+    print(f"{CVIOLET2}{s}{CEND}")
 
 
 def print_purple(s: str) -> None:
     """Prints s in purple"""
-    print("{}{}{}".format(CVIOLET, s, CEND))
+    print(f"{CVIOLET}{s}{CEND}")
 
 
 def print_cyan(s: str) -> None:
     """Prints s in cyan"""
-    print("{}{}{}".format(CCYAN, s, CEND))
+    print(f"{CCYAN}{s}{CEND}")
 
 
 def print_light_gray(s: str) -> None:
     """Prints s in light gray"""
-    print("{}{}{}".format(CGRAYL, s, CEND))
+    print(f"{CGRAYL}{s}{CEND}")
 
 
 def print_line() -> None:
@@ -108,5 +108,5 @@ def print_between_cyan_line(msg: str) -> None:
 
 def print_outro(table_item: Any) -> None:
     print_line()
-    print_green("End test of {}".format(table_item))
+    print_green(f"End test of {table_item}")
     print_double()
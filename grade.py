@@ -7,6 +7,7 @@ import importlib.util as iutil
 import os
 import signal
 import sys
+from functools import cached_property
 from typing import Any
 
 from rich.prompt import Prompt
@@ -17,7 +18,9 @@ from common.env import Env
 from common.grades import Grades
 from common.hw_base import RubricItem
 
-assignments: list[Any] = []
+# Maps hw subdir -> its grader.py. Graders are only imported when needed.
+grader_paths: dict[str, str] = {}
+_loaded_graders: dict[str, Any] = {}
 
 
 def parse_args() -> argparse.Namespace:
@@ -92,28 +95,88 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _prompt(prompt: str, choices: tuple[str, ...] | None = None) -> str:
+    """Prompts for free text, or for one of choices if given.
+
+    Validation is left to Rich; ^D just re-prompts.
+    """
+    while True:
+        try:
+            return Prompt.ask(
+                prompt,
+                choices=list(choices) if choices else None,
+                case_sensitive=False,
+            )
+        except EOFError:
+            print("^D")
+
+
+def read_aliases(subdir: str) -> set[str]:
+    """Reads the optional aliases.txt sidecar next to a grader.py.
+
+    This lets an alias be resolved without importing every grader.
+    """
+    alias_file = os.path.join(
+        os.path.dirname(grader_paths[subdir]), "aliases.txt"
+    )
+    if not utils.file_exists(alias_file):
+        return set()
+    with open(alias_file, "r") as f:
+        return {line.strip().lower() for line in f if line.strip()}
+
+
+def load_grader(subdir: str) -> Any:
+    """Imports the grader.py of subdir (at most once) and returns it."""
+    if subdir not in _loaded_graders:
+        spec = iutil.spec_from_file_location(subdir, grader_paths[subdir])
+        assert spec
+        assert spec.loader
+        grader = iutil.module_from_spec(spec)
+        sys.modules[subdir] = grader
+        spec.loader.exec_module(grader)
+        _loaded_graders[subdir] = grader
+    return _loaded_graders[subdir]
+
+
+def find_assignment(hw_name: str) -> Any | None:
+    """Returns the grader module whose ALIASES contain hw_name, if any.
+
+    Subdirs whose name (or aliases.txt) matches hw_name are tried first, so
+    usually only a single grader.py gets imported.
+    """
+    key = hw_name.lower()
+    tried: set[str] = set()
+
+    def candidates():
+        # Generated lazily so aliases.txt is only read if no name matches.
+        yield from (s for s in grader_paths if s.lower() == key)
+        yield from (s for s in grader_paths if key in read_aliases(s))
+        yield from grader_paths
+
+    for subdir in candidates():
+        if subdir in tried:
+            continue
+        tried.add(subdir)
+        assignment = load_grader(subdir)
+        if key in assignment.ALIASES:
+            return assignment
+    return None
+
+
 def main():
     """Entry-point into the grader"""
 
     grading_env = Env()
-    _, subdirs, _ = next(os.walk(grading_env.get_data_dir()))
-    asgmnt_map: dict[str, Any] = {}
-    for subdir in subdirs:
-        if subdir[0] != ".":
-            spec = iutil.spec_from_file_location(
-                subdir,
-                os.path.join(grading_env.get_hw_dir(subdir), "grader.py"),
-            )
-            assert spec
-            assert spec.loader
-            grader = iutil.module_from_spec(spec)
-            # assignments.append(importlib.import_module(f"{subdir}.grader"))
-            sys.modules[subdir] = grader
-            spec.loader.exec_module(grader)
-            assignments.append(grader)
-            asgmnt_map[subdir] = grader
-
-    if not assignments:
+    with os.scandir(grading_env.get_data_dir()) as entries:
+        grader_paths.update(
+            {
+                e.name: os.path.join(e.path, "grader.py")
+                for e in entries
+                if e.is_dir() and e.name[0] != "."
+            }
+        )
+
+    if not grader_paths:
         sys.exit(f"No available homeworks in '{grading_env.get_data_dir()}'")
 
     args = parse_args()
@@ -127,7 +190,7 @@ def main():
     }
     if not args.hw:
         args.hw = Prompt.ask(
-            choices=list(asgmnt_map.keys()),
+            choices=list(grader_paths.keys()),
             prompt="Which homework are you grading?",
             case_sensitive=False
         )
@@ -155,10 +218,11 @@ def main():
             f":{p.CBLUE}\\w{p.CCYAN} ${p.CEND} "
         )
         p.print_red("[ ^D/exit when done ]")
-        os.system(
-            f"PROMPT_COMMAND='PS1=\"{prompt}\"; unset PROMPT_COMMAND' " f"bash"
-        )
-        sys.exit()
+        shell_env = os.environ.copy()
+        shell_env["PROMPT_COMMAND"] = f'PS1="{prompt}"; unset PROMPT_COMMAND'
+        # Replace this process with the shell; execvpe never returns.
+        sys.stdout.flush()
+        os.execvpe("bash", ["bash"], shell_env)
 
     tester.pregrade()
     tester.grade()
@@ -215,28 +279,34 @@ class Grader:
         self.hw_class.grader = self
         self.gradables: dict[str, Any] | None = {}
 
-        signal.signal(signal.SIGINT, self.hw_class.exit_handler)
+        # SIGINT handler is installed on first grade(); read-only modes
+        # (dump/status/inspect) exit before then and don't need it.
+        self._sig_installed = False
 
         self.grades_file = os.path.join(
             self.hw_class.hw_workspace, "grades.json"
         )
+        # Dumping/status only read grades, so never rewrite grades.json.
         self.grades = Grades(
-            self.grades_file, self.hw_class.rubric, self.submitter
+            self.grades_file,
+            self.hw_class.rubric,
+            self.submitter,
+            read_only=env.get("dump_grades", False) or env.get("status", False),
         )
 
     def _get_hw_class(self):
-        for assignment in assignments:
-            if self.hw_name.lower() in assignment.ALIASES:
-                return assignment.GRADER(self.submitter)
-        sys.exit(f"Unsupported assignment: {self.hw_name}")
+        assignment = find_assignment(self.hw_name)
+        if not assignment:
+            sys.exit(f"Unsupported assignment: {self.hw_name}")
+        return assignment.GRADER(self.submitter)
 
     def print_intro(self, rubric_code: str):
         p.print_intro(self.submitter, self.hw_name, rubric_code)
 
     def print_headerline(self, rubric_item: RubricItem):
-        header = "Grading {}".format(rubric_item.code)
+        header = f"Grading {rubric_item.code}"
         if rubric_item.deduct_from:
-            header += " ({}p, deductive)".format(rubric_item.deduct_from)
+            header += f" ({rubric_item.deduct_from}p, deductive)"
         p.print_green(header)
 
     def print_header(self, rubric_item: RubricItem):
@@ -246,10 +316,10 @@ class Grader:
         p.print_double()
 
     def print_subitems(self, rubric_item: RubricItem):
-        for i, (pts, desc) in enumerate(rubric_item.subitems, 1):
-            p.print_magenta(
-                "{}.{} ({}p): {}".format(rubric_item.code, i, pts, desc)
-            )
+        for code, (pts, desc) in zip(
+            rubric_item.subitem_codes, rubric_item.subitems
+        ):
+            p.print_magenta(f"{code} ({pts}p): {desc}")
 
     def print_subitem_grade(self, code: str, warn: bool = False):
         if self.grades.is_graded(code):
@@ -274,43 +344,37 @@ class Grader:
             if len(autogrades) != len(rubric_item.subitems):
                 raise Exception("Autogrades don't align with rubric item!")
 
-            for i, (a, c) in enumerate(autogrades, 1):
-                subitem_code = f"{rubric_item.code}.{i}"
+            for subitem_code, (a, c) in zip(
+                rubric_item.subitem_codes, autogrades
+            ):
                 self.grades[subitem_code]["award"] = a == "y"
                 self.grades[subitem_code]["comments"] = c
 
         else:
-            for i, (pts, desc) in enumerate(rubric_item.subitems, 1):
-                subitem_code = f"{rubric_item.code}.{i}"
+            for subitem_code, (pts, desc) in zip(
+                rubric_item.subitem_codes, rubric_item.subitems
+            ):
                 p.print_magenta(f"{subitem_code} ({pts}p): {desc}")
                 self.print_subitem_grade(subitem_code)
-                while True:
-                    try:
-                        award = input(f"{p.CBLUE2}Apply? [y/n]: {p.CEND}")
-                        award = award.strip().lower()
-                        if award in ("y", "n"):
-                            break
-                    except EOFError:
-                        print("^D")
-                        continue
-                while True:
-                    try:
-                        comments = input(f"{p.CBLUE2}Comments: {p.CEND}")
-                        break
-                    except EOFError:
-                        print("^D")
-                        continue
+                award = _prompt("[bright_blue]Apply?[/]", ("y", "n"))
+                comments = _prompt("[bright_blue]Comments[/]")
 
                 self.grades[subitem_code]["award"] = award == "y"
-                self.grades[subitem_code]["comments"] = comments.strip()
+                self.grades[subitem_code]["comments"] = comments
 
-        self.grades.synchronize()
+        if autogrades:
+            # Autogrades can be regenerated, so they're written out in
+            # batches; grade() flushes whatever is left.
+            self.grades.mark_dirty()
+        else:
+            # Don't risk losing grades the TA typed in (e.g. to a SIGHUP
+            # from tmux_grade.py killing the session).
+            self.grades.synchronize()
 
     def _check_valid_table(self, table_key: str):
         """Given a key (i.e A, C, N) check if its a valid rubric item"""
 
-        keys = [*self.hw_class.rubric.keys()]
-        if table_key not in keys:
+        if table_key not in self.hw_class.rubric:
             raise ValueError(f"{self.hw_name} does not have table {table_key}")
 
     def _check_valid_item(self, item_key: str):
@@ -319,8 +383,7 @@ class Grader:
         Assumes the table is valid (use _check_valid_table() for validation on
         that).
         """
-        keys = [*self.hw_class.rubric[item_key[0]].keys()]
-        if item_key not in keys:
+        if item_key not in self.hw_class.rubric[item_key[0]]:
             raise ValueError(
                 f"{self.hw_name} does not have " f"rubric item {item_key}"
             )
@@ -339,29 +402,46 @@ class Grader:
         self.grade(pregrade=True)
 
     def grade(self, pregrade: bool = False):
+        if not self._sig_installed:
+            signal.signal(signal.SIGINT, self.hw_class.exit_handler)
+            self._sig_installed = True
+
         key = self.rubric_code
         self.print_intro(key)
-        if key.lower() == "all":
-            self.grade_all(pregrade)
-        elif key.isalpha():
-            # e.g. A, B, C, ...
-            table = key.upper()
-            self._check_valid_table(table)
-            self.grade_table(table, pregrade)
-        else:
-            # e.g. A1, B4, ...
-            table = key[0].upper()
-            item = key.upper()
-            self._check_valid_table(table)
-            self._check_valid_item(item)
-            rubric_item_obj = self.hw_class.rubric[table][item]
-            self.grade_item(rubric_item_obj, pregrade)
+        try:
+            if key.lower() == "all":
+                self.grade_all(pregrade)
+            elif key.isalpha():
+                # e.g. A, B, C, ...
+                table = key.upper()
+                self._check_valid_table(table)
+                self.grade_table(table, pregrade)
+            else:
+                # e.g. A1, B4, ...
+                table = key[0].upper()
+                item = key.upper()
+                self._check_valid_table(table)
+                self._check_valid_item(item)
+                rubric_item_obj = self.hw_class.rubric[table][item]
+                self.grade_item(rubric_item_obj, pregrade)
+        finally:
+            # Writes out batched autogrades. Also runs on SIGINT, since exit
+            # handlers raise SystemExit, but not on SIGHUP/SIGTERM.
+            self.grades.flush()
+
+    @cached_property
+    def _ordered_items(self) -> list[RubricItem]:
+        """Every rubric item in grading order, built on first grade_all."""
+        return [
+            rubric_item
+            for table_key, table in self.hw_class.rubric.items()
+            if table_key != "late_penalty"
+            for rubric_item in table.values()
+        ]
 
     def grade_all(self, pregrade: bool):
-        for table in self.hw_class.rubric:
-            if table == "late_penalty":
-                continue
-            self.grade_table(table, pregrade)
+        for rubric_item in self._ordered_items:
+            self.grade_item(rubric_item, pregrade)
 
     def grade_table(self, table_key: str, pregrade: bool):
         table = self.hw_class.rubric[table_key]
@@ -381,16 +461,12 @@ class Grader:
         return (
             not self.test_only
             and not self.regrade
-            and all(
-                self.grades.is_graded(f"{rubric_item.code}.{si}")
-                for si, _ in enumerate(rubric_item.subitems, 1)
-            )
+            and all(map(self.grades.is_graded, rubric_item.subitem_codes))
         )
 
     def show_grades(self, rubric_item: RubricItem) -> None:
         # Let the grader know if the subitems have been graded yet
-        for i in range(1, len(rubric_item.subitems) + 1):
-            code = f"{rubric_item.code}.{i}"
+        for code in rubric_item.subitem_codes:
             self.print_subitem_grade(code, warn=True)
 
     def grade_item(self, rubric_item: RubricItem, pregrade: bool):